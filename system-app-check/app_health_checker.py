@@ -1,26 +1,104 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
+import io
+import math
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import random
+import re
 import time
 import sys
 import json
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from urllib.parse import urlparse
 import argparse
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+@dataclass(slots=True)
+class CheckResult:
+    """Outcome of a single application check; slots keep per-record memory
+    small when thousands of results accumulate"""
+    name: str
+    url: str
+    status: str
+    status_code: int | None
+    response_time_ms: float | None
+    timestamp: float
+    has_critical: bool = False
+    has_success: bool = False
+    error: str | None = None
+
+
 class ApplicationHealthChecker:
     def __init__(self, config_file=None):
         self.results = []
         self.config = self.load_config(config_file)
-        
+
+        # (method, url) -> (monotonic timestamp, result) for TTL caching
+        self._cache = {}
+
+        # Guards results/cache mutation when checks run in worker threads
+        self._results_lock = threading.Lock()
+
+        # Lazily-opened SMTP connection reused across alerts
+        self._smtp = None
+
+        # Optional NDJSON sink: one result line appended per completed check,
+        # so long-running monitors never re-serialize the whole history
+        self._results_fp = None
+        if self.config.get('stream_output'):
+            self._results_fp = open(self.config['stream_output'], 'a', buffering=1 << 16)
+
+        # Per-check output is buffered here and flushed in one write so hot
+        # loops don't pay a stdio flush per message
+        self._out = io.StringIO()
+
+        # Reuse one session so keep-alive connections skip repeated
+        # DNS + TCP + TLS handshakes between checks
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Specialized hot-loop check built once against the loaded config
+        self._check = self._compile_check()
+
     def load_config(self, config_file):
         """Load configuration from JSON file or use defaults"""
         default_config = {
             "timeout": 10,
+            "connect_timeout": 5,
+            "per_host_deadline": 15,
             "retry_attempts": 3,
             "retry_delay": 2,
+            "retry_max_delay": 10,
+            "cache_ttl": 5,
+            "max_scan_bytes": 65536,
+            "parallel_mode": "async",
+            "max_workers": 32,
+            "http2": False,
+            "stream_output": None,
             "expected_status_codes": [200, 201, 202, 204],
             "critical_keywords": ["error", "exception", "down", "maintenance"],
             "success_keywords": ["success", "ok", "running", "healthy"],
@@ -32,181 +110,647 @@ class ApplicationHealthChecker:
         if config_file:
             try:
                 with open(config_file, 'r') as f:
-                    user_config = json.load(f)
+                    if orjson is not None:
+                        user_config = orjson.loads(f.read())
+                    else:
+                        user_config = json.load(f)
                     default_config.update(user_config)
             except FileNotFoundError:
                 print(f"⚠️  Config file {config_file} not found. Using defaults.")
-            except json.JSONDecodeError:
+            except ValueError:  # covers both orjson and stdlib decode errors
                 print(f"⚠️  Invalid JSON in config file {config_file}. Using defaults.")
         
+        # Freeze for O(1) membership tests in the per-check hot path
+        default_config['expected_status_codes'] = frozenset(default_config['expected_status_codes'])
+
+        # Compile keyword lists into single-pass case-insensitive scanners
+        # so checks avoid lowercasing whole bodies and rescanning per keyword
+        self._critical_re = self._compile_keywords(default_config['critical_keywords'])
+        self._success_re = self._compile_keywords(default_config['success_keywords'])
+
+        # Overlap carried between chunks so keywords split across a chunk
+        # boundary are still found
+        all_keywords = default_config['critical_keywords'] + default_config['success_keywords']
+        self._keyword_overlap = max(map(len, all_keywords), default=1) - 1
+
         return default_config
-    
-    def check_application(self, url, name=None, method='GET', headers=None, data=None):
+
+    @staticmethod
+    def _compile_keywords(keywords):
+        # An empty alternation would match everything; None means
+        # "nothing to look for", matching the baseline any([]) behavior
+        if not keywords:
+            return None
+        return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+    def _cached_result(self, cache_key):
+        """Return a recent result for (method, url) if still within cache_ttl"""
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.config['cache_ttl']:
+            return cached[1]
+        return None
+
+    def _write_result_line(self, result):
+        """Append one NDJSON line to the streaming sink, if enabled"""
+        if self._results_fp is None:
+            return
+        if orjson is not None:
+            line = orjson.dumps(result, option=orjson.OPT_SERIALIZE_DATACLASS).decode()
+        else:
+            line = json.dumps(asdict(result))
+        self._results_fp.write(line + '\n')
+
+    def _flush_output(self):
+        """Write everything buffered so far to stdout in a single call"""
+        buffered = self._out.getvalue()
+        if buffered:
+            sys.stdout.write(buffered)
+            sys.stdout.flush()
+            # Truncate in place: the compiled check closure holds a
+            # reference to this buffer
+            self._out.seek(0)
+            self._out.truncate()
+
+    def _timeout_result(self, name, url, error):
+        """Result recorded when a host exhausts its per_host_deadline"""
+        return CheckResult(
+            name=name,
+            url=url,
+            status='TIMEOUT',
+            status_code=None,
+            response_time_ms=None,
+            timestamp=time.time(),
+            error=f"Per-host deadline of {self.config['per_host_deadline']}s exceeded: {error}"
+        )
+
+    def _retry_delay(self, attempt):
+        """Exponential backoff capped at retry_max_delay, with jitter so
+        concurrent checkers don't stampede the same host in lockstep"""
+        delay = min(self.config['retry_max_delay'],
+                    self.config['retry_delay'] * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.5)
+
+    def _scan_content(self, chunks):
+        """Scan text chunks incrementally, stopping as soon as both keyword
+        verdicts are decided or max_scan_bytes have been examined"""
+        critical_re = self._critical_re
+        success_re = self._success_re
+        has_critical = False
+        has_success = False
+        scanned = 0
+        tail = ''
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode('utf-8', errors='replace')
+
+            window = tail + chunk
+            if not has_critical and critical_re is not None and critical_re.search(window):
+                has_critical = True
+            if not has_success and success_re is not None and success_re.search(window):
+                has_success = True
+
+            scanned += len(chunk)
+            # A missing scanner counts as decided: its flag can never flip
+            critical_decided = has_critical or critical_re is None
+            success_decided = has_success or success_re is None
+            if (critical_decided and success_decided) or scanned >= self.config['max_scan_bytes']:
+                break
+            tail = window[-self._keyword_overlap:] if self._keyword_overlap else ''
+
+        return has_critical, has_success
+
+    def check_application(self, url, name=None, method='GET', headers=None, data=None, body_check=True):
         """Check if application is up and functioning correctly"""
         if name is None:
             name = url
-        
-        print(f"🔍 Checking {name}...")
-        
-        for attempt in range(self.config['retry_attempts']):
-            try:
-                start_time = time.time()
-                
-                if method.upper() == 'GET':
-                    response = requests.get(
-                        url, 
-                        timeout=self.config['timeout'],
-                        headers=headers,
-                        verify=False  # For testing with self-signed certs
-                    )
-                elif method.upper() == 'POST':
-                    response = requests.post(
+
+        # Status-code-only endpoints don't need a body at all
+        if not body_check:
+            method = 'HEAD'
+
+        cache_key = (method.upper(), url)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            with self._results_lock:
+                self.results.append(cached)
+            return cached
+
+        return self._check(cache_key, url, name, headers, data, body_check)
+
+    def _compile_check(self):
+        """Build the hot check loop as a closure with config values, session
+        and scanners bound to locals, so each attempt skips the repeated
+        dict and attribute lookups of reading self.config inline"""
+        request = self.session.request
+        request_timeout = (self.config['connect_timeout'], self.config['timeout'])
+        retries = self.config['retry_attempts']
+        expected = self.config['expected_status_codes']
+        per_host_deadline = self.config['per_host_deadline']
+        scan_content = self._scan_content
+        retry_delay = self._retry_delay
+        timeout_result = self._timeout_result
+        write_result_line = self._write_result_line
+        results_lock = self._results_lock
+        results = self.results
+        cache = self._cache
+        out = self._out
+        now = time.time
+        monotonic = time.monotonic
+        sleep = time.sleep
+
+        def do_check(cache_key, url, name, headers, data, body_check):
+            out.write(f"\U0001f50d Checking {name}...\n")
+
+            # Overall budget for this host, across all retry attempts
+            deadline = monotonic() + per_host_deadline
+
+            for attempt in range(retries):
+                try:
+                    start_time = now()
+
+                    response = request(
+                        cache_key[0],
                         url,
-                        timeout=self.config['timeout'],
+                        timeout=request_timeout,
                         headers=headers,
                         data=data,
-                        verify=False
+                        verify=False,  # For testing with self-signed certs
+                        stream=True
+                    )
+
+                    response_time = round((now() - start_time) * 1000, 2)
+
+                    # Check status code
+                    status_ok = response.status_code in expected
+
+                    # Check response content for critical/success keywords,
+                    # downloading only as much of the body as the scan needs
+                    if body_check:
+                        has_critical_keyword, has_success_keyword = scan_content(
+                            response.iter_content(chunk_size=4096, decode_unicode=True)
+                        )
+                    else:
+                        has_critical_keyword = has_success_keyword = False
+                    response.close()  # Release the connection back to the pool
+
+                    # Determine application status
+                    if status_ok and not has_critical_keyword:
+                        status = "UP"
+                        status_emoji = "\u2705"
+                    else:
+                        status = "DOWN"
+                        status_emoji = "\u274c"
+
+                    result = CheckResult(
+                        name=name,
+                        url=url,
+                        status=status,
+                        status_code=response.status_code,
+                        response_time_ms=response_time,
+                        timestamp=now(),
+                        has_critical=has_critical_keyword,
+                        has_success=has_success_keyword
                     )
+
+                    with results_lock:
+                        results.append(result)
+                        cache[cache_key] = (monotonic(), result)
+                        write_result_line(result)
+
+                    out.write(f"{status_emoji} {name}: {status} "
+                              f"(Status: {response.status_code}, "
+                              f"Response Time: {response_time}ms)\n")
+
+                    return result
+
+                except requests.exceptions.RequestException as e:
+                    if attempt < retries - 1:
+                        if monotonic() >= deadline:
+                            # Don't burn further retries on a host that has
+                            # already used up its whole time budget
+                            result = timeout_result(name, url, e)
+                            with results_lock:
+                                results.append(result)
+                                cache[cache_key] = (monotonic(), result)
+                                write_result_line(result)
+                            out.write(f"\u274c {name}: TIMEOUT ({result.error})\n")
+                            return result
+                        out.write(f"\u26a0\ufe0f  Attempt {attempt + 1} failed for {name}. Retrying...\n")
+                        sleep(retry_delay(attempt))
+                    else:
+                        result = CheckResult(
+                            name=name,
+                            url=url,
+                            status='DOWN',
+                            status_code=None,
+                            response_time_ms=None,
+                            timestamp=now(),
+                            error=str(e)
+                        )
+
+                        with results_lock:
+                            results.append(result)
+                            cache[cache_key] = (monotonic(), result)
+                            write_result_line(result)
+                        out.write(f"\u274c {name}: DOWN (Error: {e})\n")
+                        return result
+
+        return do_check
+    
+    async def _check_application_async(self, session, out, url, name=None, method='GET', headers=None, data=None, body_check=True):
+        """Async version of check_application using a shared aiohttp session;
+        writes its messages to out so concurrent checks don't interleave"""
+        if name is None:
+            name = url
+
+        # Status-code-only endpoints don't need a body at all
+        if not body_check:
+            method = 'HEAD'
+
+        cache_key = (method.upper(), url)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        out.write(f"🔍 Checking {name}...\n")
+
+        # Overall budget for this host, across all retry attempts
+        deadline = time.monotonic() + self.config['per_host_deadline']
+
+        for attempt in range(self.config['retry_attempts']):
+            try:
+                start_time = time.time()
+
+                async with session.request(
+                    method.upper(),
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=self.config['timeout'],
+                                                  connect=self.config['connect_timeout']),
+                    headers=headers,
+                    data=data,
+                    ssl=False  # For testing with self-signed certs
+                ) as response:
+                    # Read at most max_scan_bytes instead of the whole body
+                    raw = await response.content.read(self.config['max_scan_bytes']) if body_check else b''
+
+                response_time = round((time.time() - start_time) * 1000, 2)
+
+                # Check status code
+                status_ok = response.status in self.config['expected_status_codes']
+
+                # Check response content for critical/success keywords
+                if body_check:
+                    text = raw.decode(response.charset or 'utf-8', errors='replace')
+                    has_critical_keyword = bool(self._critical_re and self._critical_re.search(text))
+                    has_success_keyword = bool(self._success_re and self._success_re.search(text))
                 else:
-                    response = requests.request(
-                        method,
-                        url,
-                        timeout=self.config['timeout'],
-                        headers=headers,
-                        data=data,
-                        verify=False
+                    has_critical_keyword = has_success_keyword = False
+
+                # Determine application status
+                if status_ok and not has_critical_keyword:
+                    status = "UP"
+                    status_emoji = "✅"
+                else:
+                    status = "DOWN"
+                    status_emoji = "❌"
+
+                result = CheckResult(
+                    name=name,
+                    url=url,
+                    status=status,
+                    status_code=response.status,
+                    response_time_ms=response_time,
+                    timestamp=time.time(),
+                    has_critical=has_critical_keyword,
+                    has_success=has_success_keyword
+                )
+
+                self._cache[cache_key] = (time.monotonic(), result)
+                self._write_result_line(result)
+
+                out.write(f"{status_emoji} {name}: {status} "
+                          f"(Status: {response.status}, "
+                          f"Response Time: {response_time}ms)\n")
+
+                return result
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < self.config['retry_attempts'] - 1:
+                    if time.monotonic() >= deadline:
+                        result = self._timeout_result(name, url, e)
+                        self._cache[cache_key] = (time.monotonic(), result)
+                        self._write_result_line(result)
+                        out.write(f"❌ {name}: TIMEOUT ({result.error})\n")
+                        return result
+                    out.write(f"⚠️  Attempt {attempt + 1} failed for {name}. Retrying...\n")
+                    await asyncio.sleep(self._retry_delay(attempt))
+                else:
+                    result = CheckResult(
+                        name=name,
+                        url=url,
+                        status='DOWN',
+                        status_code=None,
+                        response_time_ms=None,
+                        timestamp=time.time(),
+                        error=str(e)
                     )
-                
+
+                    self._cache[cache_key] = (time.monotonic(), result)
+                    self._write_result_line(result)
+                    out.write(f"❌ {name}: DOWN (Error: {e})\n")
+                    return result
+
+    async def _check_application_h2(self, client, out, url, name=None, method='GET', headers=None, data=None, body_check=True):
+        """HTTP/2 variant of the async check, driven by a shared httpx client
+        so URLs on the same host multiplex streams over one connection"""
+        if name is None:
+            name = url
+
+        # Status-code-only endpoints don't need a body at all
+        if not body_check:
+            method = 'HEAD'
+
+        cache_key = (method.upper(), url)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        out.write(f"🔍 Checking {name}...\n")
+
+        # Overall budget for this host, across all retry attempts
+        deadline = time.monotonic() + self.config['per_host_deadline']
+
+        for attempt in range(self.config['retry_attempts']):
+            try:
+                start_time = time.time()
+
+                raw = b''
+                # data= form-encodes dicts like the requests/aiohttp paths do
+                async with client.stream(method.upper(), url, headers=headers, data=data) as response:
+                    if body_check:
+                        # Read at most max_scan_bytes instead of the whole body
+                        async for chunk in response.aiter_bytes():
+                            raw += chunk
+                            if len(raw) >= self.config['max_scan_bytes']:
+                                break
+
                 response_time = round((time.time() - start_time) * 1000, 2)
-                
+
                 # Check status code
                 status_ok = response.status_code in self.config['expected_status_codes']
-                
+
                 # Check response content for critical/success keywords
-                content = response.text.lower()
-                has_critical_keyword = any(keyword in content for keyword in self.config['critical_keywords'])
-                has_success_keyword = any(keyword in content for keyword in self.config['success_keywords'])
-                
+                if body_check:
+                    text = raw.decode(response.charset_encoding or 'utf-8', errors='replace')
+                    has_critical_keyword = bool(self._critical_re and self._critical_re.search(text))
+                    has_success_keyword = bool(self._success_re and self._success_re.search(text))
+                else:
+                    has_critical_keyword = has_success_keyword = False
+
                 # Determine application status
                 if status_ok and not has_critical_keyword:
-                    if has_success_keyword:
-                        status = "UP"
-                        status_emoji = "✅"
-                    else:
-                        status = "UP"
-                        status_emoji = "✅"
+                    status = "UP"
+                    status_emoji = "✅"
                 else:
                     status = "DOWN"
                     status_emoji = "❌"
-                
-                result = {
-                    'name': name,
-                    'url': url,
-                    'status': status,
-                    'status_code': response.status_code,
-                    'response_time_ms': response_time,
-                    'timestamp': datetime.now().isoformat(),
-                    'content_analysis': {
-                        'has_critical_keywords': has_critical_keyword,
-                        'has_success_keywords': has_success_keyword
-                    }
-                }
-                
-                self.results.append(result)
-                
-                print(f"{status_emoji} {name}: {status} "
-                      f"(Status: {response.status_code}, "
-                      f"Response Time: {response_time}ms)")
-                
+
+                result = CheckResult(
+                    name=name,
+                    url=url,
+                    status=status,
+                    status_code=response.status_code,
+                    response_time_ms=response_time,
+                    timestamp=time.time(),
+                    has_critical=has_critical_keyword,
+                    has_success=has_success_keyword
+                )
+
+                self._cache[cache_key] = (time.monotonic(), result)
+                self._write_result_line(result)
+
+                out.write(f"{status_emoji} {name}: {status} "
+                          f"(Status: {response.status_code}, "
+                          f"Response Time: {response_time}ms)\n")
+
                 return result
-                
-            except requests.exceptions.RequestException as e:
+
+            except (httpx.HTTPError, asyncio.TimeoutError) as e:
                 if attempt < self.config['retry_attempts'] - 1:
-                    print(f"⚠️  Attempt {attempt + 1} failed for {name}. Retrying...")
-                    time.sleep(self.config['retry_delay'])
+                    if time.monotonic() >= deadline:
+                        result = self._timeout_result(name, url, e)
+                        self._cache[cache_key] = (time.monotonic(), result)
+                        self._write_result_line(result)
+                        out.write(f"❌ {name}: TIMEOUT ({result.error})\n")
+                        return result
+                    out.write(f"⚠️  Attempt {attempt + 1} failed for {name}. Retrying...\n")
+                    await asyncio.sleep(self._retry_delay(attempt))
                 else:
-                    result = {
-                        'name': name,
-                        'url': url,
-                        'status': 'DOWN',
-                        'status_code': None,
-                        'response_time_ms': None,
-                        'timestamp': datetime.now().isoformat(),
-                        'error': str(e)
-                    }
-                    
-                    self.results.append(result)
-                    print(f"❌ {name}: DOWN (Error: {e})")
+                    result = CheckResult(
+                        name=name,
+                        url=url,
+                        status='DOWN',
+                        status_code=None,
+                        response_time_ms=None,
+                        timestamp=time.time(),
+                        error=str(e)
+                    )
+
+                    self._cache[cache_key] = (time.monotonic(), result)
+                    self._write_result_line(result)
+                    out.write(f"❌ {name}: DOWN (Error: {e})\n")
                     return result
-    
+
+    async def _check_multiple_h2(self, applications):
+        """Run all checks over one HTTP/2-capable httpx client, dispatching
+        host-by-host so same-host URLs share a multiplexed connection"""
+        buffers = [io.StringIO() for _ in applications]
+
+        # Same-host checks dispatched together land on the same connection
+        order = sorted(range(len(applications)),
+                       key=lambda i: urlparse(applications[i]['url']).netloc)
+
+        limits = httpx.Limits(max_keepalive_connections=32)
+        timeout = httpx.Timeout(self.config['timeout'],
+                                connect=self.config['connect_timeout'])
+        async with httpx.AsyncClient(http2=True, verify=False,
+                                     timeout=timeout,
+                                     limits=limits) as client:
+            gathered = await asyncio.gather(
+                *[self._check_application_h2(client, buffers[i], **applications[i])
+                  for i in order]
+            )
+
+        # Results and output keep the caller's submission order
+        results = [None] * len(applications)
+        for i, result in zip(order, gathered):
+            results[i] = result
+        self.results.extend(results)
+        sys.stdout.write(''.join(buf.getvalue() for buf in buffers))
+        sys.stdout.flush()
+
+    async def _check_multiple_async(self, applications):
+        """Run all checks concurrently over a single pooled aiohttp session"""
+        buffers = [io.StringIO() for _ in applications]
+        connector = aiohttp.TCPConnector(limit=64, ssl=False)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *[self._check_application_async(session, buf, **app)
+                  for buf, app in zip(buffers, applications)]
+            )
+
+        # Results and output are collected in submission order instead of
+        # being appended from each coroutine, so both stay deterministic
+        self.results.extend(results)
+        sys.stdout.write(''.join(buf.getvalue() for buf in buffers))
+        sys.stdout.flush()
+
     def check_multiple_applications(self, applications):
-        """Check multiple applications"""
+        """Check multiple applications (concurrently when aiohttp is available)"""
         print("🚀 Starting Application Health Check...")
         print("=" * 60)
-        
-        for app in applications:
-            self.check_application(**app)
-        
+
+        mode = self.config.get('parallel_mode', 'async')
+
+        if mode == 'async' and httpx is not None and self.config.get('http2'):
+            asyncio.run(self._check_multiple_h2(applications))
+        elif mode == 'async' and aiohttp is not None:
+            asyncio.run(self._check_multiple_async(applications))
+        elif mode in ('async', 'threads'):
+            # requests releases the GIL during socket reads, so threads still
+            # overlap the network waits when aiohttp isn't available
+            with ThreadPoolExecutor(max_workers=self.config.get('max_workers', 32)) as executor:
+                list(executor.map(lambda app: self.check_application(**app), applications))
+            self._flush_output()
+        else:
+            for app in applications:
+                self.check_application(**app)
+            self._flush_output()
+
         print("=" * 60)
         self.generate_report()
     
     def generate_report(self):
         """Generate a summary report"""
         total_checks = len(self.results)
-        up_checks = len([r for r in self.results if r['status'] == 'UP'])
+
+        # Aggregate everything in one pass over the results
+        up_checks = 0
+        timed_checks = 0
+        sum_time = 0.0
+        min_time = math.inf
+        max_time = 0.0
+        down_apps = []
+
+        for r in self.results:
+            if r.status == 'UP':
+                up_checks += 1
+                if r.response_time_ms:
+                    timed_checks += 1
+                    sum_time += r.response_time_ms
+                    min_time = min(min_time, r.response_time_ms)
+                    max_time = max(max_time, r.response_time_ms)
+            else:
+                down_apps.append(r)
+
         down_checks = total_checks - up_checks
-        
-        print(f"\n📊 HEALTH CHECK SUMMARY")
-        print(f"Total Applications: {total_checks}")
-        print(f"✅ UP: {up_checks}")
-        print(f"❌ DOWN: {down_checks}")
-        print(f"📈 Success Rate: {(up_checks/total_checks)*100:.1f}%")
-        
+
+        # Assemble the whole report and emit it with a single write,
+        # instead of one stdio flush per line
+        report = [
+            f"\n📊 HEALTH CHECK SUMMARY",
+            f"Total Applications: {total_checks}",
+            f"✅ UP: {up_checks}",
+            f"❌ DOWN: {down_checks}",
+            f"📈 Success Rate: {(up_checks/total_checks)*100:.1f}%",
+        ]
+
         # Show response times for UP applications
-        up_times = [r['response_time_ms'] for r in self.results if r['status'] == 'UP' and r['response_time_ms']]
-        if up_times:
-            avg_time = sum(up_times) / len(up_times)
-            max_time = max(up_times)
-            min_time = min(up_times)
-            print(f"⏱️  Response Times - Avg: {avg_time:.2f}ms, Min: {min_time:.2f}ms, Max: {max_time:.2f}ms")
-        
+        if timed_checks:
+            avg_time = sum_time / timed_checks
+            report.append(f"⏱️  Response Times - Avg: {avg_time:.2f}ms, Min: {min_time:.2f}ms, Max: {max_time:.2f}ms")
+
         # Show details for DOWN applications
-        down_apps = [r for r in self.results if r['status'] == 'DOWN']
         if down_apps:
-            print(f"\n🔴 DOWN APPLICATIONS:")
-            for app in down_apps:
-                print(f"   - {app['name']}: {app.get('error', 'Unknown error')}")
-        
+            report.append(f"\n🔴 DOWN APPLICATIONS:")
+            report.append('\n'.join(f"   - {app.name}: {app.error or 'Unknown error'}"
+                                    for app in down_apps))
+
+        print('\n'.join(report))
+
         return up_checks == total_checks
     
+    def _smtp_send(self, msg):
+        """Send over the persistent SMTP connection, opening it on first use"""
+        if self._smtp is None:
+            self._smtp = smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port'])
+            self._smtp.ehlo()
+        self._smtp.send_message(msg)
+
     def send_alert(self, subject, message):
         """Send email alert if configured"""
         if not self.config.get('alert_email'):
             return
-        
+
         try:
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = self.config['alert_email']
             msg['To'] = self.config['alert_email']
             msg['Subject'] = subject
-            
-            msg.attach(MIMEText(message, 'plain'))
-            
-            server = smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port'])
-            server.send_message(msg)
-            server.quit()
-            
+            msg.set_content(message)
+
+            try:
+                self._smtp_send(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped the idle connection; reconnect and retry once
+                self._smtp = None
+                self._smtp_send(msg)
+
             print(f"📧 Alert email sent to {self.config['alert_email']}")
         except Exception as e:
             print(f"⚠️  Failed to send alert email: {e}")
     
+    def close(self):
+        """Flush any buffered output and release pooled connections"""
+        self._flush_output()
+        self.session.close()
+        if self._results_fp is not None:
+            self._results_fp.close()
+            self._results_fp = None
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+
     def save_results(self, filename=None):
         """Save results to JSON file"""
         if filename is None:
             filename = f"health_check_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
+
+        # With streaming enabled the NDJSON sink already holds every result;
+        # just flush and copy it instead of re-serializing the whole list
+        if self._results_fp is not None:
+            self._results_fp.flush()
+            shutil.copyfile(self.config['stream_output'], filename)
+            print(f"💾 Results saved to {filename}")
+            return
+
+        # Timestamps are kept as floats in the hot path and only rendered
+        # to ISO strings here, when results actually leave the process
+        records = [asdict(r) for r in self.results]
+        for record in records:
+            record['timestamp'] = datetime.fromtimestamp(record['timestamp']).isoformat()
+
         with open(filename, 'w') as f:
-            json.dump(self.results, f, indent=2)
+            if orjson is not None:
+                f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2).decode())
+            else:
+                json.dump(records, f, indent=2)
         
         print(f"💾 Results saved to {filename}")
 
@@ -217,10 +761,14 @@ def main():
     parser.add_argument('-f', '--file', help='File with list of URLs (JSON)')
     parser.add_argument('-s', '--save', help='Save results to file')
     parser.add_argument('--email', action='store_true', help='Send email alerts')
-    
+    parser.add_argument('--no-cache', action='store_true', help='Always probe, ignoring recent cached results')
+
     args = parser.parse_args()
-    
+
     checker = ApplicationHealthChecker(args.config)
+
+    if args.no_cache:
+        checker.config['cache_ttl'] = 0
     
     applications = []
     
@@ -245,7 +793,7 @@ def main():
         applications = [
             {'url': 'http://localhost:30007', 'name': 'WiseCow App'},
             {'url': 'https://httpbin.org/status/200', 'name': 'HTTPBin Test'},
-            {'url': 'https://google.com', 'name': 'Google'},
+            {'url': 'https://google.com', 'name': 'Google', 'body_check': False},
         ]
     
     # Perform health checks
@@ -256,14 +804,16 @@ def main():
         checker.save_results(args.save)
     
     # Send alert if any application is down and email is configured
-    down_apps = [r for r in checker.results if r['status'] == 'DOWN']
+    down_apps = [r for r in checker.results if r.status != 'UP']
     if down_apps and args.email:
         subject = f"🚨 Application Health Alert - {len(down_apps)} apps down"
         message = f"The following applications are down:\n"
         for app in down_apps:
-            message += f"- {app['name']}: {app.get('error', 'Unknown error')}\n"
+            message += f"- {app.name}: {app.error or 'Unknown error'}\n"
         checker.send_alert(subject, message)
-    
+
+    checker.close()
+
     # Exit with appropriate code
     sys.exit(0 if not down_apps else 1)
 